@@ -1,13 +1,32 @@
 # This script reads data from a Google Sheet and exports it to a formatted PDF.
 
 import gspread
+from gspread.utils import a1_range_to_grid_range, absolute_range_name, rowcol_to_a1
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, select_proxy
 from google.oauth2.service_account import Credentials
-import json
+import orjson
+from xml.sax.saxutils import escape
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, LongTable, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER
+from reportlab.lib import colors
+from reportlab.pdfgen import canvas
+from reportlab import rl_config
+from reportlab.pdfbase import pdfmetrics
+from reportlab.lib.utils import simpleSplit
+import functools
+import itertools
 import os
+import queue
+import ssl
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # =========================================================================
 # === IMPORTANT: SETUP INSTRUCTIONS BEFORE YOU RUN THIS SCRIPT ===
@@ -19,11 +38,17 @@ import os
 #    - Shared your Google Sheet with the service account.
 # 2. You need to install the 'reportlab' library for PDF generation.
 #    - Run this command in your active virtual environment: pip install reportlab
+#    - The debug dump uses 'orjson': pip install orjson
+#    - HTTP/2 support uses 'httpx' with its 'h2' extra: pip install "httpx[http2]"
 # 3. Replace the placeholder values for SPREADSHEET_ID and WORKSHEET_NAME below.
 
 # The path to your service account credentials file.
 CREDENTIALS_FILE = 'credentials.json'
 
+# The OAuth scopes requested for the service account.
+SCOPE = ['https://www.googleapis.com/auth/spreadsheets',
+         'https://www.googleapis.com/auth/drive']
+
 # Replace with the ID of your Google Sheet.
 # You can find the spreadsheet ID in the URL.
 SPREADSHEET_ID = '19o6daH5dkhwr1bCdKHEKcnH-EylgNJaFy-q76wyZMns'
@@ -31,61 +56,133 @@ SPREADSHEET_ID = '19o6daH5dkhwr1bCdKHEKcnH-EylgNJaFy-q76wyZMns'
 # Replace with the name of the worksheet (e.g., 'Sheet1', 'Data').
 WORKSHEET_NAME = 'Sheet1'
 
+# Replace with the header names of the columns to export, in sheet order. They
+# must be the leftmost columns of the worksheet; only these are requested from
+# the API. Leave empty to export every column.
+COLUMNS = []
+
+# The worksheet is fetched this many rows at a time. Sheets that do not fit
+# in the first page are fetched in a background thread while the low-level
+# streaming exporter writes the rows already received to the PDF. That
+# exporter lists each record as "key: value" lines instead of a table.
+PAGE_ROWS = 5000
+
+# Set to True to dump the rows read from the sheet to the console, as one
+# JSON array per page of PAGE_ROWS rows.
+DEBUG = False
+
+# Query parameters for every values request sent to the Sheets API. Values
+# are returned unformatted to keep the response small, so number formatting is
+# dropped on purpose: percentages, currency and thousands separators print as
+# raw numbers ("50%" as 0.5, "$1,234.00" as 1234). Dates and times stay
+# formatted, as they would otherwise come back as serial numbers in the PDF.
+_VALUE_PARAMS = {'valueRenderOption': 'UNFORMATTED_VALUE',
+                 'dateTimeRenderOption': 'FORMATTED_STRING',
+                 'majorDimension': 'ROWS'}
+
+# Write compressed PDF streams as raw binary. By default ReportLab also wraps
+# every zlib stream in ASCII85, which costs CPU and makes the file larger.
+rl_config.useA85 = 0
+
+# Load the built-in Helvetica faces used by both exporters into ReportLab's
+# font registry up front, instead of on the first string drawn.
+for _font_name in ('Helvetica', 'Helvetica-Bold'):
+    pdfmetrics.getFont(_font_name)
+
+# PDF styles are built once at import time and shared by every export.
+_STYLES = getSampleStyleSheet()
+
+# A custom style for the title.
+_TITLE_STYLE = ParagraphStyle(
+    'TitleStyle',
+    parent=_STYLES['Heading1'],
+    fontName='Helvetica-Bold',
+    fontSize=18,
+    leading=22,
+    alignment=TA_CENTER
+)
+
+# A style for the data paragraphs.
+_DATA_STYLE = ParagraphStyle(
+    'DataStyle',
+    parent=_STYLES['Normal'],
+    fontName='Helvetica',
+    fontSize=10,
+    leading=12,
+)
+
+# A style for the table header cells that need wrapping.
+_HEADER_STYLE = ParagraphStyle(
+    'HeaderStyle',
+    parent=_DATA_STYLE,
+    fontName='Helvetica-Bold',
+)
+
+# Sheets whose columns would be narrower than this (in points) are listed as
+# "key: value" lines instead of a table.
+_MIN_COLUMN_WIDTH = 54
+
+# The style for the records table, with a shaded header row. The fonts apply
+# to cells that are plain strings and match the paragraph styles above.
+_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
 def export_to_pdf(data, filename="google_sheet_data.pdf"):
     """
-    Exports a list of dictionaries to a formatted PDF file.
+    Exports an iterable of dictionaries to a formatted PDF file.
+    The records are consumed in a single pass, so a generator can be passed in.
     """
     try:
         # Create a new PDF document.
-        doc = SimpleDocTemplate(filename, pagesize=letter)
+        doc = SimpleDocTemplate(filename, pagesize=letter, pageCompression=1)
         
         # A list to hold the elements to be added to the PDF.
         elements = []
-        
-        # Get standard styles from ReportLab.
-        styles = getSampleStyleSheet()
-        
-        # Define a custom style for the title.
-        title_style = ParagraphStyle(
-            'TitleStyle',
-            parent=styles['Heading1'],
-            fontName='Helvetica-Bold',
-            fontSize=18,
-            leading=22,
-            alignment=TA_CENTER
-        )
-        
-        # Define a style for the data paragraphs.
-        data_style = ParagraphStyle(
-            'DataStyle',
-            parent=styles['Normal'],
-            fontName='Helvetica',
-            fontSize=10,
-            leading=12,
-        )
 
         # Add a title to the PDF.
-        elements.append(Paragraph("Google Sheet Data Report", title_style))
+        elements.append(Paragraph("Google Sheet Data Report", _TITLE_STYLE))
         elements.append(Spacer(1, 12))
         
-        # Check if there is data to write.
-        if not data:
-            elements.append(Paragraph("No data found to export.", data_style))
+        # Peek at the first record to find the columns and check if there is
+        # data to write, without consuming the rest of the iterable.
+        records = iter(data)
+        first = next(records, None)
+        if first is None:
+            elements.append(Paragraph("No data found to export.", _DATA_STYLE))
         else:
-            # Iterate through each record (row) in the data.
-            for i, record in enumerate(data):
-                # Start a new paragraph for each record.
-                elements.append(Paragraph(f"<b>Record {i+1}:</b>", styles['Normal']))
-                elements.append(Spacer(1, 6))
-
-                # Format the record's key-value pairs.
-                record_text = ""
-                for key, value in record.items():
-                    # Create a string for each key-value pair.
-                    record_text += f"<b>{key}:</b> {value}<br/>"
-                
-                elements.append(Paragraph(record_text, data_style))
-                elements.append(Spacer(1, 12)) # Add a space between records.
+            header = list(first.keys())
+            all_records = itertools.chain([first], records)
+            if header and doc.width / len(header) >= _MIN_COLUMN_WIDTH:
+                # Lay the records out as a single table with one row per
+                # record. LongTable splits across pages on its own and repeats
+                # the header row, so no per-record flowables are needed. Rows
+                # taller than a page are split across pages too.
+                col_width = doc.width / len(header)
+                cell_width = col_width - 12  # minus the default cell padding
+                header_cells = [_cell(key, _HEADER_STYLE, cell_width) for key in header]
+                rows = ([_cell(record.get(key, ''), _DATA_STYLE, cell_width) for key in header]
+                        for record in all_records)
+                table = LongTable([header_cells, *rows], repeatRows=1, splitInRow=1,
+                                  colWidths=[col_width] * len(header))
+                table.setStyle(_TABLE_STYLE)
+                elements.append(table)
+            else:
+                # Too many columns to fit side by side: list each record as
+                # "key: value" lines instead, like export_to_pdf_streaming.
+                for i, record in enumerate(all_records):
+                    elements.append(Paragraph(f"<b>Record {i+1}:</b>", _DATA_STYLE))
+                    elements.append(Spacer(1, 6))
+                    record_text = "<br/>".join(
+                        f"<b>{escape(str(key))}:</b> {escape(str(value))}"
+                        for key, value in record.items())
+                    elements.append(Paragraph(record_text, _DATA_STYLE))
+                    elements.append(Spacer(1, 12))
 
         # Build the PDF file with all the elements.
         doc.build(elements)
@@ -93,7 +190,348 @@ def export_to_pdf(data, filename="google_sheet_data.pdf"):
 
     except Exception as e:
         print(f"An error occurred while creating the PDF: {e}")
-        print("Please ensure your data is a list of dictionaries and reportlab is installed correctly.")
+        print("Please ensure your data is an iterable of dictionaries and reportlab is installed correctly.")
+
+
+def export_to_pdf_streaming(data_iter, filename="google_sheet_data.pdf"):
+    """
+    Exports an iterable of dictionaries to a PDF file page by page.
+    Unlike export_to_pdf, nothing is buffered beyond the current page, so the
+    records are written as "Record N:" blocks of "key: value" lines rather
+    than as a table, whose column layout needs every row up front.
+    """
+    try:
+        c = canvas.Canvas(filename, pagesize=letter, pageCompression=1)
+        width, height = letter
+        margin = 72
+        line_height = 12
+        text_width = width - 2 * margin
+        y = height - margin
+
+        # Add a title to the first page.
+        c.setFont('Helvetica-Bold', 18)
+        c.drawCentredString(width / 2, y, "Google Sheet Data Report")
+        y -= 24
+
+        # Write the lines through a text object: ReportLab collects its
+        # operators in a list and joins them once when the page is drawn,
+        # instead of emitting a separate text block for every drawString.
+        text = c.beginText(margin, y)
+        font = None
+        count = 0
+        for i, record in enumerate(data_iter):
+            # A heading line, the wrapped "key: value" lines and a gap.
+            lines = [(f"Record {i+1}:", 'Helvetica-Bold')]
+            for key, value in record.items():
+                lines.extend((line, 'Helvetica') for line in
+                             _wrap(f"{key}: {value}", 'Helvetica', 10, text_width))
+            lines.append(("", 'Helvetica'))
+
+            # Start a new page when the whole record no longer fits above the
+            # bottom margin, unless the page is still empty.
+            page_top = text.getY() >= height - margin - 24
+            if not page_top and text.getY() - len(lines) * line_height < margin:
+                c.drawText(text)
+                c.showPage()
+                text, font = c.beginText(margin, height - margin), None
+
+            for line, line_font in lines:
+                # A record taller than a whole page carries on to the next.
+                if text.getY() < margin:
+                    c.drawText(text)
+                    c.showPage()
+                    text, font = c.beginText(margin, height - margin), None
+                if line_font != font:
+                    text.setFont(line_font, 10, line_height)
+                    font = line_font
+                text.textLine(line)
+            count = i + 1
+
+        if not count:
+            text.setFont('Helvetica', 10)
+            text.textLine("No data found to export.")
+
+        c.drawText(text)
+        c.save()
+        print(f"Successfully exported data to '{os.path.abspath(filename)}'")
+
+    except _PageFetchError:
+        # A failed page fetch is reported by read_google_sheet, and the PDF is
+        # left unsaved rather than silently truncated.
+        raise
+    except Exception as e:
+        print(f"An error occurred while creating the PDF: {e}")
+        print("Please ensure your data is an iterable of dictionaries and reportlab is installed correctly.")
+
+
+def _wrap(text, font_name, font_size, width):
+    """
+    Splits text into lines no wider than width, breaking on spaces where
+    possible and inside words that are too long for a line on their own.
+    """
+    lines = []
+    for paragraph in text.split('\n'):
+        for line in simpleSplit(paragraph, font_name, font_size, width) or ['']:
+            while pdfmetrics.stringWidth(line, font_name, font_size) > width:
+                cut = len(line) - 1
+                while cut > 1 and pdfmetrics.stringWidth(line[:cut], font_name, font_size) > width:
+                    cut -= 1
+                lines.append(line[:cut])
+                line = line[cut:]
+            lines.append(line)
+    return lines
+
+
+def _cell(value, style, width):
+    """
+    Returns a table cell for value. Text that fits on one line stays a plain
+    string, which is cheap to lay out; anything longer becomes an escaped
+    Paragraph so it wraps inside the column instead of running into the next.
+    """
+    text = str(value)
+    if '\n' not in text and pdfmetrics.stringWidth(text, style.fontName, style.fontSize) <= width:
+        return text
+    return Paragraph(escape(text).replace('\n', '<br/>'), style)
+
+
+def _ssl_context(verify, cert):
+    """
+    Builds the SSL context for requests-style verify and cert settings.
+    verify is a bool or a CA bundle file or directory; cert is a client
+    certificate file or a (certificate, key) pair.
+    """
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif verify is True:
+        context = ssl.create_default_context(cafile=DEFAULT_CA_BUNDLE_PATH)
+    elif os.path.isdir(verify):
+        context = ssl.create_default_context(capath=verify)
+    else:
+        context = ssl.create_default_context(cafile=verify)
+    if cert:
+        if isinstance(cert, str):
+            context.load_cert_chain(cert)
+        else:
+            context.load_cert_chain(*cert)
+    return context
+
+
+class _HTTP2Adapter(BaseAdapter):
+    """
+    A requests transport adapter that sends requests through an httpx client.
+    Sheets API calls share one persistent HTTP/2 connection per combination
+    of the TLS and proxy settings requests passes in.
+
+    Limits: the whole body is always read before send returns, so stream=True
+    still gets a fully buffered response. Set-Cookie headers are not stored
+    in session.cookies, which the Sheets API does not need.
+    """
+
+    # Connection-specific headers are not allowed in HTTP/2 requests.
+    _HOP_BY_HOP_HEADERS = {'connection', 'keep-alive', 'transfer-encoding', 'upgrade'}
+
+    def __init__(self):
+        super().__init__()
+        self._clients = {}
+
+    def _client(self, verify, cert, proxy):
+        """
+        Returns the httpx client for the given settings, creating it on first use.
+        """
+        key = (verify, cert, proxy)
+        if key not in self._clients:
+            # requests has already merged the environment (REQUESTS_CA_BUNDLE,
+            # HTTPS_PROXY, ...) into these settings, so httpx must not re-read it.
+            self._clients[key] = httpx.Client(
+                http2=True, verify=_ssl_context(verify, cert), proxy=proxy,
+                trust_env=False, limits=httpx.Limits(max_keepalive_connections=8))
+        return self._clients[key]
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        client = self._client(verify, cert, select_proxy(request.url, proxies))
+
+        # requests allows a (connect, read) tuple as well as a single timeout.
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        headers = {key: value for key, value in request.headers.items()
+                   if key.lower() not in self._HOP_BY_HOP_HEADERS}
+        try:
+            reply = client.request(
+                request.method, request.url, headers=headers,
+                content=request.body, timeout=timeout)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+
+        # Convert the reply into the requests.Response gspread expects.
+        response = requests.Response()
+        response.status_code = reply.status_code
+        response.reason = reply.reason_phrase
+        response.headers = CaseInsensitiveDict(reply.headers)
+        response.encoding = reply.encoding
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content = reply.content
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
+
+
+def _range(start_row, end_row):
+    """
+    Returns the A1 range of the given worksheet rows, limited to COLUMNS.
+    """
+    if COLUMNS:
+        end_cell = rowcol_to_a1(end_row, len(COLUMNS))
+        return absolute_range_name(WORKSHEET_NAME, f"A{start_row}:{end_cell}")
+    return absolute_range_name(WORKSHEET_NAME, f"{start_row}:{end_row}")
+
+
+def _rows(header, rows):
+    """
+    Yields one dictionary per data row, keyed by the header row.
+    """
+    for row in rows:
+        # Rows with empty trailing cells come back shorter than the header.
+        row = row + [''] * (len(header) - len(row))
+        yield dict(zip(header, row))
+
+
+def _last_row(a1_range):
+    """
+    Returns the number of the last row covered by an A1 range.
+    """
+    cells = a1_range.rsplit('!', 1)[-1]
+    return a1_range_to_grid_range(cells)['endRowIndex']
+
+
+def _row_count(sheet):
+    """
+    Returns the number of rows in the worksheet grid, from the sheet metadata.
+    """
+    metadata = sheet.fetch_sheet_metadata(
+        params={'fields': 'sheets.properties(title,gridProperties.rowCount)'})
+    for worksheet in metadata.get('sheets', []):
+        properties = worksheet['properties']
+        if properties['title'] == WORKSHEET_NAME:
+            return properties['gridProperties']['rowCount']
+    raise gspread.exceptions.WorksheetNotFound(WORKSHEET_NAME)
+
+
+def _put(batches, stop, item):
+    """
+    Puts item on the batches queue, giving up if stop is set while it is full.
+    """
+    while not stop.is_set():
+        try:
+            batches.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            pass
+
+
+def _fetch_pages(sheet, start_row, row_count, blank_rows, batches, stop):
+    """
+    Fetches the worksheet PAGE_ROWS rows at a time from start_row up to
+    row_count and puts each page of raw rows on the batches queue, followed by
+    None. blank_rows is the number of empty rows that ended the previous page.
+    If a request fails, the exception is put on the queue instead of None.
+    Fetching ends early once stop is set.
+    """
+    try:
+        while start_row <= row_count and not stop.is_set():
+            end_row = min(start_row + PAGE_ROWS - 1, row_count)
+            response = sheet.values_get(
+                _range(start_row, end_row), params=_VALUE_PARAMS)
+            rows = response.get('values', [])
+            if rows:
+                # The API drops empty rows from the end of every range. Put
+                # back the ones held over from earlier pages now that more
+                # data follows them; empty rows at the end of the sheet stay dropped.
+                _put(batches, stop, [[]] * blank_rows + rows)
+                blank_rows = 0
+            blank_rows += (end_row - start_row + 1) - len(rows)
+            start_row = end_row + 1
+        last = None
+    except Exception as e:
+        last = e
+    _put(batches, stop, last)
+
+
+class _PageFetchError(Exception):
+    """
+    Raised while exporting when the background fetch of a page failed.
+    The original exception is chained as __cause__.
+    """
+
+
+def _drain(batches):
+    """
+    Yields each page of rows put on the batches queue until None arrives.
+    An exception put on the queue by the fetching thread is raised here,
+    wrapped in _PageFetchError.
+    """
+    for rows in iter(batches.get, None):
+        if isinstance(rows, Exception):
+            raise _PageFetchError(rows) from rows
+        yield rows
+
+
+def _records(header, pages):
+    """
+    Yields one dictionary per data row from pages of raw rows. In debug mode
+    each page is dumped to the console in one write. The number of records
+    is reported once the last page has been read.
+    """
+    count = 0
+    for rows in pages:
+        records = _rows(header, rows)
+        if DEBUG:
+            records = list(records)
+            # Flush pending text output so the raw bytes land after it.
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(
+                records, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            sys.stdout.buffer.write(b"\n")
+        for record in records:
+            count += 1
+            yield record
+
+    if count:
+        print(f"\nData found: {count} records.")
+    else:
+        print("No data found in the worksheet.")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_credentials():
+    """
+    Loads the service account credentials once per process.
+    Parsing the key file and building the RSA signer is only done on first use.
+    """
+    return Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=SCOPE)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client():
+    """
+    Authorizes the gspread client once per process.
+    Later calls reuse the client and its warm HTTP/2 connection.
+    """
+    gc = gspread.authorize(_get_credentials())
+
+    # Send every Sheets API call over one persistent HTTP/2 connection so
+    # only the first request pays for the TCP and TLS handshake.
+    gc.http_client.session.mount('https://', _HTTP2Adapter())
+    return gc
 
 
 def read_google_sheet():
@@ -102,38 +540,93 @@ def read_google_sheet():
     Then, it calls the export_to_pdf function.
     """
     try:
-        # Load credentials from the JSON file.
-        scope = ['https://www.googleapis.com/auth/spreadsheets',
-                 'https://www.googleapis.com/auth/drive']
-        creds = Credentials.from_service_account_file(
-            CREDENTIALS_FILE, scopes=scope)
+        # Fail fast, before any setup or network work, if the key file is missing.
+        if not os.path.exists(CREDENTIALS_FILE):
+            raise FileNotFoundError(CREDENTIALS_FILE)
 
-        # Authorize the gspread client.
-        gc = gspread.authorize(creds)
+        # Get the authorized client (created once and reused across calls).
+        # Its session fetches a new access token only when the cached one has
+        # expired, right before the next request.
+        gc = _get_client()
 
         print("Authentication successful!")
 
-        # Open the specified spreadsheet and worksheet.
+        # Open the specified spreadsheet.
         sheet = gc.open_by_key(SPREADSHEET_ID)
-        worksheet = sheet.worksheet(WORKSHEET_NAME)
 
-        print(f"Reading data from worksheet '{worksheet.title}'...")
+        print(f"Reading data from worksheet '{WORKSHEET_NAME}'...")
 
-        # Get all records from the worksheet as a list of dictionaries.
-        data = worksheet.get_all_records()
-        
-        # Check if any data was found and print it.
-        if data:
-            print("\nData found:")
-            for row in data:
-                print(json.dumps(row, indent=2))
-            
-            # Call the PDF export function with the data.
-            export_to_pdf(data)
+        # Fetch the first page of the worksheet with a single batchGet
+        # request. This skips gspread's per-cell record conversion, and for
+        # sheets that fit in one page, the separate worksheet metadata call.
+        # Further ranges can be added to the same round-trip.
+        response = sheet.values_batch_get(
+            [_range(1, PAGE_ROWS + 1)],
+            params=_VALUE_PARAMS)
+        value_range = (response.get('valueRanges') or [{}])[0]
+        values = value_range.get('values', [])
+
+        # Only the first len(COLUMNS) columns were requested, so check that
+        # they really are the configured ones before exporting anything.
+        if COLUMNS and values and values[0][:len(COLUMNS)] != COLUMNS:
+            raise gspread.exceptions.GSpreadException(
+                f"The first {len(COLUMNS)} columns of worksheet '{WORKSHEET_NAME}' "
+                f"are {values[0][:len(COLUMNS)]}, not COLUMNS {COLUMNS}. "
+                "Please list the leftmost column headers in COLUMNS.")
+
+        # Records are keyed by the header names, so a blank header row would
+        # drop every value and duplicates would silently merge columns.
+        if len(values) > 1 and not values[0]:
+            raise gspread.exceptions.GSpreadException(
+                f"The header row of worksheet '{WORKSHEET_NAME}' is empty. "
+                "Please put the column names in the first row.")
+        if values and len(set(values[0])) != len(values[0]):
+            duplicates = sorted({str(key) for key in values[0] if values[0].count(key) > 1})
+            raise gspread.exceptions.GSpreadException(
+                f"The header row of worksheet '{WORKSHEET_NAME}' contains "
+                f"duplicate names: {', '.join(repr(key) for key in duplicates)}. "
+                "Please make every column header unique.")
+
+        # The API drops empty rows from the end of every range, so a short
+        # page does not mean the sheet has ended. The returned range is
+        # clipped to the worksheet grid, so the real row count only has to be
+        # looked up when the grid reaches past the first page.
+        row_count = PAGE_ROWS + 1
+        if 'range' in value_range:
+            row_count = _last_row(value_range['range'])
+        if row_count >= PAGE_ROWS + 1:
+            row_count = _row_count(sheet)
+
+        # Both export paths read the rows as pages and turn them into
+        # dictionaries lazily as the PDF is written.
+        header = values[0] if values else []
+
+        # If the grid has more rows than the first page, fetch the rest in a
+        # background thread while this one writes the PDF, so the wall time is
+        # roughly the slower of the two instead of their sum.
+        if values and row_count > PAGE_ROWS + 1:
+            print(f"\nStreaming records to PDF in pages of {PAGE_ROWS}...")
+            blank_rows = PAGE_ROWS + 1 - len(values)
+            batches = queue.Queue(maxsize=2)
+            batches.put(values[1:])
+            del values
+            stop = threading.Event()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(
+                    _fetch_pages, sheet, PAGE_ROWS + 2, row_count, blank_rows,
+                    batches, stop)
+                try:
+                    export_to_pdf_streaming(_records(header, _drain(batches)))
+                except _PageFetchError as e:
+                    # Report the fetch error itself through the handlers below.
+                    raise e.__cause__
+                finally:
+                    # Stop the fetching thread if the export ended early.
+                    stop.set()
         else:
-            print("No data found in the worksheet.")
-            # Still call the function to create an empty PDF with a message.
-            export_to_pdf(data)
+            # Call the PDF export function with the data. An empty sheet still
+            # gets a PDF with a message.
+            export_to_pdf(_records(header, [itertools.islice(values, 1, None)]))
 
     except gspread.exceptions.SpreadsheetNotFound:
         print(f"Error: Spreadsheet with ID '{SPREADSHEET_ID}' not found.")
@@ -141,6 +634,15 @@ def read_google_sheet():
     except gspread.exceptions.WorksheetNotFound:
         print(f"Error: Worksheet named '{WORKSHEET_NAME}' not found.")
         print("Please double-check the worksheet name.")
+    except gspread.exceptions.APIError as e:
+        # A range naming a worksheet that does not exist cannot be parsed.
+        if e.code == 400 and "Unable to parse range" in str(e):
+            print(f"Error: Worksheet named '{WORKSHEET_NAME}' not found.")
+            print("Please double-check the worksheet name.")
+        else:
+            print(f"Error: The Google Sheets API returned an error: {e}")
+    except gspread.exceptions.GSpreadException as e:
+        print(f"Error: {e}")
     except FileNotFoundError:
         print("Error: The 'credentials.json' file was not found.")
         print("Please make sure it's in the same directory as the script.")